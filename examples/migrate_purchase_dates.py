@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+"""One-off migration converting string purchase dates to native Neo4j dates."""
+
+from home_alog.database import GraphOperations
+
+
+if __name__ == "__main__":
+    graph = GraphOperations()
+    migrated = graph.migrate_purchase_dates()
+    print(f"Converted purchase_date on {migrated} items")
@@ -1,30 +1,66 @@
 """Neo4j database connection and operations."""
 
 import os
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 from contextlib import contextmanager
 
-from neo4j import GraphDatabase, Driver, Session
+from neo4j import GraphDatabase, Driver, Record, Session, READ_ACCESS, WRITE_ACCESS
 from dotenv import load_dotenv
 
 
+_env_loaded = False
+
+
+def _load_env():
+    """Load variables from .env once per process."""
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()
+        _env_loaded = True
+
+
 class Neo4jConnection:
-    """Manages Neo4j database connection."""
+    """Manages Neo4j database connection.
+    
+    Driver pool settings default to:
+        max_connection_pool_size: 50 (NEO4J_POOL_SIZE)
+        connection_acquisition_timeout: 60 seconds (NEO4J_ACQ_TIMEOUT)
+        connection_timeout: 30 seconds (NEO4J_CONNECTION_TIMEOUT)
+        max_transaction_retry_time: 30 seconds (NEO4J_MAX_RETRY_TIME)
+    """
     
-    def __init__(self, uri: Optional[str] = None, user: Optional[str] = None, password: Optional[str] = None):
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        max_connection_pool_size: Optional[int] = None,
+        connection_acquisition_timeout: Optional[float] = None,
+        connection_timeout: Optional[float] = None,
+        max_transaction_retry_time: Optional[float] = None
+    ):
         """Initialize Neo4j connection.
         
         Args:
             uri: Neo4j connection URI (defaults to env var NEO4J_URI)
             user: Neo4j username (defaults to env var NEO4J_USER)
             password: Neo4j password (defaults to env var NEO4J_PASSWORD)
+            max_connection_pool_size: Maximum pooled connections (defaults to env var NEO4J_POOL_SIZE)
+            connection_acquisition_timeout: Seconds to wait for a pooled connection (defaults to env var NEO4J_ACQ_TIMEOUT)
+            connection_timeout: Seconds to wait for a new connection (defaults to env var NEO4J_CONNECTION_TIMEOUT)
+            max_transaction_retry_time: Seconds to keep retrying a transaction function (defaults to env var NEO4J_MAX_RETRY_TIME)
         """
-        load_dotenv()
+        _load_env()
         
         self.uri = uri or os.getenv("NEO4J_URI", "bolt://localhost:7687")
         self.user = user or os.getenv("NEO4J_USER", "neo4j")
         self.password = password or os.getenv("NEO4J_PASSWORD", "")
         
+        self.max_connection_pool_size = max_connection_pool_size or int(os.getenv("NEO4J_POOL_SIZE", "50"))
+        self.connection_acquisition_timeout = connection_acquisition_timeout or float(os.getenv("NEO4J_ACQ_TIMEOUT", "60"))
+        self.connection_timeout = connection_timeout or float(os.getenv("NEO4J_CONNECTION_TIMEOUT", "30"))
+        self.max_transaction_retry_time = max_transaction_retry_time or float(os.getenv("NEO4J_MAX_RETRY_TIME", "30"))
+        
         self._driver: Optional[Driver] = None
     
     def connect(self) -> Driver:
@@ -32,7 +68,12 @@ class Neo4jConnection:
         if self._driver is None:
             self._driver = GraphDatabase.driver(
                 self.uri,
-                auth=(self.user, self.password)
+                auth=(self.user, self.password),
+                max_connection_pool_size=self.max_connection_pool_size,
+                connection_acquisition_timeout=self.connection_acquisition_timeout,
+                connection_timeout=self.connection_timeout,
+                max_transaction_retry_time=self.max_transaction_retry_time,
+                keep_alive=True
             )
         return self._driver
     
@@ -43,10 +84,14 @@ class Neo4jConnection:
             self._driver = None
     
     @contextmanager
-    def session(self) -> Session:
-        """Context manager for Neo4j sessions."""
+    def session(self, access_mode: str = WRITE_ACCESS) -> Session:
+        """Context manager for Neo4j sessions.
+        
+        Args:
+            access_mode: Default access mode, used to route auto-commit queries
+        """
         driver = self.connect()
-        session = driver.session()
+        session = driver.session(default_access_mode=access_mode)
         try:
             yield session
         finally:
@@ -66,6 +111,73 @@ class Neo4jConnection:
             result = session.run(query, parameters or {})
             return [dict(record) for record in result]
     
+    def write_query(self, query: str, parameters: Optional[dict[str, Any]] = None) -> list[dict[str, Any]]:
+        """Execute a Cypher write query in a managed, retried write transaction.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            
+        Returns:
+            List of result records as dictionaries
+        """
+        def run(tx):
+            return [dict(record) for record in tx.run(query, parameters or {})]
+        
+        with self.session() as session:
+            return session.execute_write(run)
+    
+    def stream_query(self, query: str, parameters: Optional[dict[str, Any]] = None) -> Iterator[dict[str, Any]]:
+        """Execute a read-only Cypher query and yield records as they arrive.
+        
+        Runs as an auto-commit query in a read session so records can be
+        consumed lazily; unlike fetch_values it is not retried on transient
+        errors.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            
+        Yields:
+            Result records as dictionaries
+        """
+        with self.session(READ_ACCESS) as session:
+            for record in session.run(query, parameters or {}):
+                yield dict(record)
+    
+    def fetch_one(self, query: str, parameters: Optional[dict[str, Any]] = None) -> Optional[Record]:
+        """Execute a read-only Cypher query expected to return at most one record.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            
+        Returns:
+            The result record, or None if the query matched nothing
+        """
+        def run(tx):
+            return tx.run(query, parameters or {}).single()
+        
+        with self.session() as session:
+            return session.execute_read(run)
+    
+    def fetch_values(self, query: str, parameters: Optional[dict[str, Any]] = None, key: str | int = 0) -> list[Any]:
+        """Execute a read-only Cypher query and return a single column of the results.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            key: Name or index of the column to return
+            
+        Returns:
+            List of values from the requested column
+        """
+        def run(tx):
+            return tx.run(query, parameters or {}).value(key)
+        
+        with self.session() as session:
+            return session.execute_read(run)
+    
     def initialize_constraints(self):
         """Create database constraints and indexes."""
         constraints = [
@@ -73,15 +185,21 @@ class Neo4jConnection:
             "CREATE CONSTRAINT location_name IF NOT EXISTS FOR (l:Location) REQUIRE l.name IS UNIQUE",
             "CREATE CONSTRAINT category_name IF NOT EXISTS FOR (c:Category) REQUIRE c.name IS UNIQUE",
             "CREATE CONSTRAINT person_name IF NOT EXISTS FOR (p:Person) REQUIRE p.name IS UNIQUE",
+            # The uniqueness constraints above already back a name index per label
+            "CREATE INDEX location_type_name IF NOT EXISTS FOR (l:Location) ON (l.type, l.name)",
+            "CREATE INDEX item_purchase_date IF NOT EXISTS FOR (i:Item) ON (i.purchase_date)",
         ]
         
         with self.session() as session:
             for constraint in constraints:
                 try:
-                    session.run(constraint)
+                    session.run(constraint).consume()
                 except Exception as e:
                     # Constraint might already exist
                     print(f"Note: {e}")
+            
+            # Make sure new indexes are online before any queries rely on them
+            session.run("CALL db.awaitIndexes()").consume()
 
 
 # Global connection instance
@@ -1,126 +1,556 @@
 """Graph operations for managing the home inventory knowledge graph."""
 
-from typing import Any, Optional
+from itertools import batched
+from typing import Any, Iterable, Iterator, Optional
+
+from neo4j.exceptions import ClientError
+from neo4j.time import Date, DateTime, Time
 
 from .connection import get_connection
 from .schema import NodeType, RelationType
 
 
+# Maximum number of rows sent in a single UNWIND batch
+BATCH_SIZE = 1000
+
+# Default maximum number of nodes returned by list/find queries
+DEFAULT_LIMIT = 1000
+
+# Rows handed to each apoc.periodic.iterate call, which batches them server-side
+APOC_ROWS_PER_CALL = 100_000
+
+
+# Values applied only when a node is first created, on every write path
+_ITEM_DEFAULTS = {"description": "", "quantity": 1, "notes": ""}
+_LOCATION_DEFAULTS = {"type": "room", "description": ""}
+_CATEGORY_DEFAULTS = {"description": ""}
+
+
+# Cypher statements are module-level constants so every call sends byte-identical,
+# fully parameterized text and hits the server's query plan cache.
+
+_CREATE_ITEM_QUERY = """
+MERGE (i:Item {name: $name})
+ON CREATE SET i += $defaults, i += $props
+ON MATCH SET i += $props
+RETURN i
+"""
+
+_CREATE_LOCATION_QUERY = """
+MERGE (l:Location {name: $name})
+ON CREATE SET l += $defaults, l += $props
+ON MATCH SET l += $props
+RETURN l
+"""
+
+_CREATE_CATEGORY_QUERY = """
+MERGE (c:Category {name: $name})
+ON CREATE SET c += $defaults, c += $props
+ON MATCH SET c += $props
+RETURN c
+"""
+
+_CREATE_PERSON_QUERY = """
+MERGE (p:Person {name: $name})
+RETURN p
+"""
+
+_CREATE_ITEMS_BULK_QUERY = """
+UNWIND $rows AS row
+MERGE (i:Item {name: row.name})
+ON CREATE SET i += $defaults, i += row
+ON MATCH SET i += row
+RETURN i
+"""
+
+_CREATE_LOCATIONS_BULK_QUERY = """
+UNWIND $rows AS row
+MERGE (l:Location {name: row.name})
+ON CREATE SET l += $defaults, l += row
+ON MATCH SET l += row
+RETURN l
+"""
+
+_CREATE_CATEGORIES_BULK_QUERY = """
+UNWIND $rows AS row
+MERGE (c:Category {name: row.name})
+ON CREATE SET c += $defaults, c += row
+ON MATCH SET c += row
+RETURN c
+"""
+
+# Non-string values never match =~, so items already holding a native date
+# and strings that are not YYYY-MM-DD are left untouched
+_MIGRATE_PURCHASE_DATES_QUERY = """
+MATCH (i:Item)
+WHERE i.purchase_date =~ '[0-9]{4}-[0-9]{2}-[0-9]{2}'
+CALL {
+    WITH i
+    SET i.purchase_date = date(i.purchase_date)
+} IN TRANSACTIONS OF $batch_size ROWS
+RETURN count(*) AS migrated
+"""
+
+_APOC_AVAILABLE_QUERY = """
+SHOW PROCEDURES YIELD name
+WHERE name = 'apoc.periodic.iterate'
+RETURN count(*) > 0 AS available
+"""
+
+_BULK_INGEST_ITEMS_APOC_QUERY = """
+CALL apoc.periodic.iterate(
+    "UNWIND $rows AS row RETURN row",
+    "MERGE (i:Item {name: row.name}) ON CREATE SET i += $defaults, i += row ON MATCH SET i += row",
+    {batchSize: $batch_size, parallel: $parallel, params: {rows: $rows, defaults: $defaults}}
+)
+YIELD total, failedOperations, errorMessages
+RETURN total, failedOperations, errorMessages
+"""
+
+_BULK_INGEST_ITEMS_QUERY = """
+UNWIND $rows AS row
+MERGE (i:Item {name: row.name})
+ON CREATE SET i += $defaults, i += row
+ON MATCH SET i += row
+"""
+
+# Each UNWIND block ends with an aggregation so the next one starts from a
+# single row instead of repeating once per row of the previous block
+_IMPORT_INVENTORY_QUERY = """
+UNWIND $locations AS row
+MERGE (l:Location {name: row.name})
+ON CREATE SET l += $location_defaults, l += row
+ON MATCH SET l += row
+WITH count(*) AS _
+UNWIND $categories AS row
+MERGE (c:Category {name: row.name})
+ON CREATE SET c += $category_defaults, c += row
+ON MATCH SET c += row
+WITH count(*) AS _
+UNWIND $items AS row
+MERGE (i:Item {name: row.name})
+ON CREATE SET i += $item_defaults, i += row
+ON MATCH SET i += row
+WITH count(*) AS _
+UNWIND $item_locations AS pair
+MATCH (i:Item {name: pair[0]})
+MATCH (l:Location {name: pair[1]})
+MERGE (i)-[:LOCATED_IN]->(l)
+WITH count(*) AS _
+UNWIND $item_categories AS pair
+MATCH (i:Item {name: pair[0]})
+MATCH (c:Category {name: pair[1]})
+MERGE (i)-[:BELONGS_TO]->(c)
+RETURN count(*) AS linked
+"""
+
+_LINK_ITEMS_TO_LOCATIONS_BULK_QUERY = """
+UNWIND $rows AS row
+MATCH (i:Item {name: row.item})
+MATCH (l:Location {name: row.location})
+MERGE (i)-[:LOCATED_IN]->(l)
+RETURN count(*) AS linked
+"""
+
+_LINK_ITEMS_TO_CATEGORIES_BULK_QUERY = """
+UNWIND $rows AS row
+MATCH (i:Item {name: row.item})
+MATCH (c:Category {name: row.category})
+MERGE (i)-[:BELONGS_TO]->(c)
+RETURN count(*) AS linked
+"""
+
+_LINK_ITEM_TO_LOCATION_QUERY = """
+MATCH (i:Item {name: $item_name})
+MATCH (l:Location {name: $location_name})
+MERGE (i)-[:LOCATED_IN]->(l)
+RETURN count(*) > 0 AS linked
+"""
+
+_LINK_ITEM_TO_CATEGORY_QUERY = """
+MATCH (i:Item {name: $item_name})
+MATCH (c:Category {name: $category_name})
+MERGE (i)-[:BELONGS_TO]->(c)
+RETURN count(*) > 0 AS linked
+"""
+
+_LINK_ITEM_TO_OWNER_QUERY = """
+MATCH (i:Item {name: $item_name})
+MATCH (p:Person {name: $person_name})
+MERGE (i)-[:OWNED_BY]->(p)
+RETURN count(*) > 0 AS linked
+"""
+
+_FIND_ITEMS_IN_LOCATION_QUERY = """
+MATCH (i:Item)-[:LOCATED_IN]->(l:Location {name: $location_name})
+RETURN i
+ORDER BY i.name
+SKIP $skip
+LIMIT $limit
+"""
+
+_ITER_ITEMS_IN_LOCATION_QUERY = """
+MATCH (i:Item)-[:LOCATED_IN]->(l:Location {name: $location_name})
+RETURN i
+ORDER BY i.name
+"""
+
+_FIND_ITEMS_BY_CATEGORY_QUERY = """
+MATCH (i:Item)-[:BELONGS_TO]->(c:Category {name: $category_name})
+RETURN i
+ORDER BY i.name
+SKIP $skip
+LIMIT $limit
+"""
+
+_ITER_ITEMS_BY_CATEGORY_QUERY = """
+MATCH (i:Item)-[:BELONGS_TO]->(c:Category {name: $category_name})
+RETURN i
+ORDER BY i.name
+"""
+
+# Pattern comprehensions collect each relationship type independently,
+# avoiding the row fan-out of chained OPTIONAL MATCHes
+_GET_ITEM_DETAILS_QUERY = """
+MATCH (i:Item {name: $item_name})
+RETURN i,
+    [(i)-[:LOCATED_IN]->(l:Location) | l.name] AS locations,
+    [(i)-[:BELONGS_TO]->(c:Category) | c.name] AS categories,
+    [(i)-[:OWNED_BY]->(p:Person) | p.name] AS owners
+"""
+
+_LIST_ALL_LOCATIONS_QUERY = "MATCH (l:Location) RETURN l ORDER BY l.name SKIP $skip LIMIT $limit"
+
+_LIST_ALL_CATEGORIES_QUERY = "MATCH (c:Category) RETURN c ORDER BY c.name SKIP $skip LIMIT $limit"
+
+_ITER_LOCATIONS_QUERY = "MATCH (l:Location) RETURN l ORDER BY l.name"
+
+_ITER_CATEGORIES_QUERY = "MATCH (c:Category) RETURN c ORDER BY c.name"
+
+
+def _without_none(props: dict[str, Any]) -> dict[str, Any]:
+    """Drop unset properties so they are neither sent nor written."""
+    return {key: value for key, value in props.items() if value is not None}
+
+
+def _item_props(props: dict[str, Any]) -> dict[str, Any]:
+    """Prepare Item properties, storing purchase_date as a native Neo4j date."""
+    props = _without_none(props)
+    if isinstance(props.get("purchase_date"), str):
+        props["purchase_date"] = Date.from_iso_format(props["purchase_date"])
+    return props
+
+
+def _properties(node: Any) -> dict[str, Any]:
+    """Copy node properties into a plain dict, with temporal values as ISO strings."""
+    return {
+        key: value.iso_format() if isinstance(value, (Date, DateTime, Time)) else value
+        for key, value in node.items()
+    }
+
+
+def _chunked(rows: Iterable[Any], size: int = BATCH_SIZE) -> Iterator[list[Any]]:
+    """Yield successive lists of at most `size` rows from any iterable."""
+    for chunk in batched(rows, size):
+        yield list(chunk)
+
+
 class GraphOperations:
     """Operations for managing nodes and relationships in the knowledge graph."""
     
     def __init__(self):
         self.db = get_connection()
+        self._apoc_available: Optional[bool] = None
     
     # ===== Node Operations =====
     
     def create_item(
         self,
         name: str,
-        description: str = "",
+        description: Optional[str] = None,
         purchase_date: Optional[str] = None,
         value: Optional[float] = None,
-        quantity: int = 1,
-        notes: str = ""
+        quantity: Optional[int] = None,
+        notes: Optional[str] = None
     ) -> dict[str, Any]:
-        """Create a new Item node.
+        """Create an Item node, or update it if one with this name exists.
+        
+        Properties passed as None are not written, so an update keeps any
+        existing value and a new item gets the default.
         
         Args:
             name: Item name (unique)
-            description: Item description
-            purchase_date: Purchase date (ISO format)
+            description: Item description (default "")
+            purchase_date: Purchase date (ISO format, stored as a native date)
             value: Monetary value
-            quantity: Number of items
-            notes: Additional notes
+            quantity: Number of items (default 1)
+            notes: Additional notes (default "")
             
         Returns:
-            Created node properties
+            Created or updated node properties
         """
-        query = """
-        CREATE (i:Item {
-            name: $name,
-            description: $description,
-            purchase_date: $purchase_date,
-            value: $value,
-            quantity: $quantity,
-            notes: $notes
-        })
-        RETURN i
-        """
-        result = self.db.execute_query(query, {
+        result = self.db.write_query(_CREATE_ITEM_QUERY, {
             "name": name,
-            "description": description,
-            "purchase_date": purchase_date,
-            "value": value,
-            "quantity": quantity,
-            "notes": notes
+            "defaults": _ITEM_DEFAULTS,
+            "props": _item_props({
+                "description": description,
+                "purchase_date": purchase_date,
+                "value": value,
+                "quantity": quantity,
+                "notes": notes
+            })
         })
-        return result[0]["i"] if result else {}
+        return _properties(result[0]["i"]) if result else {}
     
-    def create_location(self, name: str, location_type: str = "room", description: str = "") -> dict[str, Any]:
-        """Create a new Location node.
+    def create_location(
+        self,
+        name: str,
+        location_type: Optional[str] = None,
+        description: Optional[str] = None
+    ) -> dict[str, Any]:
+        """Create a Location node, or update it if one with this name exists.
+        
+        Properties passed as None are not written, so an update keeps any
+        existing value and a new location gets the default.
         
         Args:
             name: Location name (unique)
-            location_type: Type of location (room, shelf, box, etc.)
-            description: Location description
+            location_type: Type of location (room, shelf, box, etc.; default "room")
+            description: Location description (default "")
             
         Returns:
-            Created node properties
-        """
-        query = """
-        CREATE (l:Location {
-            name: $name,
-            type: $location_type,
-            description: $description
-        })
-        RETURN l
+            Created or updated node properties
         """
-        result = self.db.execute_query(query, {
+        result = self.db.write_query(_CREATE_LOCATION_QUERY, {
             "name": name,
-            "location_type": location_type,
-            "description": description
+            "defaults": _LOCATION_DEFAULTS,
+            "props": _without_none({
+                "type": location_type,
+                "description": description
+            })
         })
-        return result[0]["l"] if result else {}
+        return _properties(result[0]["l"]) if result else {}
     
-    def create_category(self, name: str, description: str = "") -> dict[str, Any]:
-        """Create a new Category node.
+    def create_category(self, name: str, description: Optional[str] = None) -> dict[str, Any]:
+        """Create a Category node, or update it if one with this name exists.
+        
+        A description passed as None is not written, so an update keeps the
+        existing value and a new category gets "".
         
         Args:
             name: Category name (unique)
-            description: Category description
+            description: Category description (default "")
             
         Returns:
-            Created node properties
-        """
-        query = """
-        CREATE (c:Category {
-            name: $name,
-            description: $description
-        })
-        RETURN c
+            Created or updated node properties
         """
-        result = self.db.execute_query(query, {
+        result = self.db.write_query(_CREATE_CATEGORY_QUERY, {
             "name": name,
-            "description": description
+            "defaults": _CATEGORY_DEFAULTS,
+            "props": _without_none({"description": description})
         })
-        return result[0]["c"] if result else {}
+        return _properties(result[0]["c"]) if result else {}
     
     def create_person(self, name: str) -> dict[str, Any]:
-        """Create a new Person node.
+        """Create a Person node if one with this name does not already exist.
         
         Args:
             name: Person name (unique)
             
         Returns:
-            Created node properties
+            Node properties
+        """
+        result = self.db.write_query(_CREATE_PERSON_QUERY, {"name": name})
+        return _properties(result[0]["p"]) if result else {}
+    
+    # ===== Bulk Operations =====
+    
+    def create_items_bulk(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create or update many Item nodes with one round-trip per batch.
+        
+        Args:
+            items: Item property maps (see ItemProperties)
+            
+        Returns:
+            Created or updated node properties
+        """
+        created = []
+        for rows in _chunked([_item_props(row) for row in items]):
+            result = self.db.write_query(_CREATE_ITEMS_BULK_QUERY, {"rows": rows, "defaults": _ITEM_DEFAULTS})
+            created.extend(_properties(record["i"]) for record in result)
+        return created
+    
+    def create_locations_bulk(self, locations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create or update many Location nodes with one round-trip per batch.
+        
+        Args:
+            locations: Location property maps (see LocationProperties)
+            
+        Returns:
+            Created or updated node properties
+        """
+        created = []
+        for rows in _chunked([_without_none(row) for row in locations]):
+            result = self.db.write_query(_CREATE_LOCATIONS_BULK_QUERY, {"rows": rows, "defaults": _LOCATION_DEFAULTS})
+            created.extend(_properties(record["l"]) for record in result)
+        return created
+    
+    def create_categories_bulk(self, categories: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create or update many Category nodes with one round-trip per batch.
+        
+        Args:
+            categories: Category property maps (see CategoryProperties)
+            
+        Returns:
+            Created or updated node properties
+        """
+        created = []
+        for rows in _chunked([_without_none(row) for row in categories]):
+            result = self.db.write_query(_CREATE_CATEGORIES_BULK_QUERY, {"rows": rows, "defaults": _CATEGORY_DEFAULTS})
+            created.extend(_properties(record["c"]) for record in result)
+        return created
+    
+    def link_items_to_locations_bulk(self, pairs: list[tuple[str, str]]) -> int:
+        """Create LOCATED_IN relationships for many (item, location) pairs.
+        
+        Args:
+            pairs: (item_name, location_name) tuples
+            
+        Returns:
+            Number of pairs where both endpoints were found
         """
-        query = """
-        CREATE (p:Person {name: $name})
-        RETURN p
+        rows = [{"item": item, "location": location} for item, location in pairs]
+        linked = 0
+        for batch in _chunked(rows):
+            result = self.db.write_query(_LINK_ITEMS_TO_LOCATIONS_BULK_QUERY, {"rows": batch})
+            linked += result[0]["linked"] if result else 0
+        return linked
+    
+    def link_items_to_categories_bulk(self, pairs: list[tuple[str, str]]) -> int:
+        """Create BELONGS_TO relationships for many (item, category) pairs.
+        
+        Args:
+            pairs: (item_name, category_name) tuples
+            
+        Returns:
+            Number of pairs where both endpoints were found
+        """
+        rows = [{"item": item, "category": category} for item, category in pairs]
+        linked = 0
+        for batch in _chunked(rows):
+            result = self.db.write_query(_LINK_ITEMS_TO_CATEGORIES_BULK_QUERY, {"rows": batch})
+            linked += result[0]["linked"] if result else 0
+        return linked
+    
+    def bulk_ingest_items(
+        self,
+        items: Iterable[dict[str, Any]],
+        batch: int = BATCH_SIZE,
+        parallel: bool = True
+    ) -> int:
+        """Create or update a large, possibly streamed, set of Item nodes.
+        
+        When APOC is installed, rows are handed to apoc.periodic.iterate,
+        which commits every `batch` rows server-side. Otherwise each batch is
+        sent as its own retried write transaction.
+        
+        With APOC and parallel=True, items must have unique names: batches
+        that MERGE the same name concurrently can fail, leaving the other
+        batches committed before RuntimeError is raised.
+        
+        Args:
+            items: Item property maps (see ItemProperties); may be a generator
+            batch: Number of rows committed per transaction
+            parallel: Let APOC run batches concurrently (ignored without APOC);
+                only safe when item names are unique across the input
+            
+        Returns:
+            Number of rows ingested
+            
+        Raises:
+            RuntimeError: If APOC reports failed batches; batches that
+                succeeded stay committed
+        """
+        rows = (_item_props(row) for row in items)
+        ingested = 0
+        
+        if self._has_apoc():
+            for chunk in _chunked(rows, APOC_ROWS_PER_CALL):
+                result = self.db.execute_query(_BULK_INGEST_ITEMS_APOC_QUERY, {
+                    "rows": chunk,
+                    "defaults": _ITEM_DEFAULTS,
+                    "batch_size": batch,
+                    "parallel": parallel
+                })
+                stats = result[0]
+                if stats["failedOperations"]:
+                    raise RuntimeError(f"Bulk ingest failed for {stats['failedOperations']} rows: {stats['errorMessages']}")
+                ingested += stats["total"]
+            return ingested
+        
+        for chunk in _chunked(rows, batch):
+            self.db.write_query(_BULK_INGEST_ITEMS_QUERY, {"rows": chunk, "defaults": _ITEM_DEFAULTS})
+            ingested += len(chunk)
+        return ingested
+    
+    def migrate_purchase_dates(self, batch: int = BATCH_SIZE) -> int:
+        """Convert Item purchase dates stored as ISO strings to native dates.
+        
+        One-off migration for items written before purchase_date was stored
+        as a date. Values that are not YYYY-MM-DD strings are skipped. Each
+        batch commits separately, so the migration can safely be re-run.
+        
+        Args:
+            batch: Number of items updated per transaction
+            
+        Returns:
+            Number of items converted
         """
-        result = self.db.execute_query(query, {"name": name})
-        return result[0]["p"] if result else {}
+        result = self.db.execute_query(_MIGRATE_PURCHASE_DATES_QUERY, {"batch_size": batch})
+        return result[0]["migrated"] if result else 0
+    
+    def _has_apoc(self) -> bool:
+        """Check once whether apoc.periodic.iterate is installed."""
+        if self._apoc_available is None:
+            try:
+                result = self.db.execute_query(_APOC_AVAILABLE_QUERY)
+                self._apoc_available = bool(result and result[0]["available"])
+            except ClientError:
+                # SHOW PROCEDURES is unsupported or not permitted; transient
+                # errors propagate so the check runs again next time
+                self._apoc_available = False
+        return self._apoc_available
+    
+    def import_inventory(
+        self,
+        locations: Optional[list[dict[str, Any]]] = None,
+        categories: Optional[list[dict[str, Any]]] = None,
+        items: Optional[list[dict[str, Any]]] = None,
+        item_locations: Optional[list[tuple[str, str]]] = None,
+        item_categories: Optional[list[tuple[str, str]]] = None
+    ) -> None:
+        """Create or update nodes and relationships in a single query and transaction.
+        
+        Everything is sent in one round-trip, so this suits small to medium
+        data sets; use the *_bulk methods for inputs that need batching.
+        
+        Args:
+            locations: Location property maps (see LocationProperties)
+            categories: Category property maps (see CategoryProperties)
+            items: Item property maps (see ItemProperties)
+            item_locations: (item_name, location_name) tuples
+            item_categories: (item_name, category_name) tuples
+        """
+        self.db.write_query(_IMPORT_INVENTORY_QUERY, {
+            "location_defaults": _LOCATION_DEFAULTS,
+            "category_defaults": _CATEGORY_DEFAULTS,
+            "item_defaults": _ITEM_DEFAULTS,
+            "locations": [_without_none(row) for row in locations or []],
+            "categories": [_without_none(row) for row in categories or []],
+            "items": [_item_props(row) for row in items or []],
+            "item_locations": [list(pair) for pair in item_locations or []],
+            "item_categories": [list(pair) for pair in item_categories or []]
+        })
     
     # ===== Relationship Operations =====
     
@@ -134,17 +564,11 @@ class GraphOperations:
         Returns:
             True if relationship was created
         """
-        query = """
-        MATCH (i:Item {name: $item_name})
-        MATCH (l:Location {name: $location_name})
-        MERGE (i)-[:LOCATED_IN]->(l)
-        RETURN i, l
-        """
-        result = self.db.execute_query(query, {
+        result = self.db.write_query(_LINK_ITEM_TO_LOCATION_QUERY, {
             "item_name": item_name,
             "location_name": location_name
         })
-        return len(result) > 0
+        return bool(result[0]["linked"]) if result else False
     
     def link_item_to_category(self, item_name: str, category_name: str) -> bool:
         """Create BELONGS_TO relationship between item and category.
@@ -156,17 +580,11 @@ class GraphOperations:
         Returns:
             True if relationship was created
         """
-        query = """
-        MATCH (i:Item {name: $item_name})
-        MATCH (c:Category {name: $category_name})
-        MERGE (i)-[:BELONGS_TO]->(c)
-        RETURN i, c
-        """
-        result = self.db.execute_query(query, {
+        result = self.db.write_query(_LINK_ITEM_TO_CATEGORY_QUERY, {
             "item_name": item_name,
             "category_name": category_name
         })
-        return len(result) > 0
+        return bool(result[0]["linked"]) if result else False
     
     def link_item_to_owner(self, item_name: str, person_name: str) -> bool:
         """Create OWNED_BY relationship between item and person.
@@ -178,51 +596,75 @@ class GraphOperations:
         Returns:
             True if relationship was created
         """
-        query = """
-        MATCH (i:Item {name: $item_name})
-        MATCH (p:Person {name: $person_name})
-        MERGE (i)-[:OWNED_BY]->(p)
-        RETURN i, p
-        """
-        result = self.db.execute_query(query, {
+        result = self.db.write_query(_LINK_ITEM_TO_OWNER_QUERY, {
             "item_name": item_name,
             "person_name": person_name
         })
-        return len(result) > 0
+        return bool(result[0]["linked"]) if result else False
     
     # ===== Query Operations =====
     
-    def find_items_in_location(self, location_name: str) -> list[dict[str, Any]]:
-        """Find all items in a specific location.
+    def iter_items_in_location(self, location_name: str) -> Iterator[dict[str, Any]]:
+        """Yield every item in a specific location as it arrives, ordered by name.
+        
+        Args:
+            location_name: Name of the location
+            
+        Yields:
+            Item properties
+        """
+        for record in self.db.stream_query(_ITER_ITEMS_IN_LOCATION_QUERY, {"location_name": location_name}):
+            yield _properties(record["i"])
+    
+    def find_items_in_location(
+        self,
+        location_name: str,
+        skip: int = 0,
+        limit: int = DEFAULT_LIMIT
+    ) -> list[dict[str, Any]]:
+        """Find items in a specific location, one page at a time.
         
         Args:
             location_name: Name of the location
+            skip: Number of items to skip, ordered by name
+            limit: Maximum number of items to return
             
         Returns:
             List of item properties
         """
-        query = """
-        MATCH (i:Item)-[:LOCATED_IN]->(l:Location {name: $location_name})
-        RETURN i
+        nodes = self.db.fetch_values(_FIND_ITEMS_IN_LOCATION_QUERY, {"location_name": location_name, "skip": skip, "limit": limit}, "i")
+        return [_properties(node) for node in nodes]
+    
+    def iter_items_by_category(self, category_name: str) -> Iterator[dict[str, Any]]:
+        """Yield every item in a specific category as it arrives, ordered by name.
+        
+        Args:
+            category_name: Name of the category
+            
+        Yields:
+            Item properties
         """
-        result = self.db.execute_query(query, {"location_name": location_name})
-        return [record["i"] for record in result]
+        for record in self.db.stream_query(_ITER_ITEMS_BY_CATEGORY_QUERY, {"category_name": category_name}):
+            yield _properties(record["i"])
     
-    def find_items_by_category(self, category_name: str) -> list[dict[str, Any]]:
-        """Find all items in a specific category.
+    def find_items_by_category(
+        self,
+        category_name: str,
+        skip: int = 0,
+        limit: int = DEFAULT_LIMIT
+    ) -> list[dict[str, Any]]:
+        """Find items in a specific category, one page at a time.
         
         Args:
             category_name: Name of the category
+            skip: Number of items to skip, ordered by name
+            limit: Maximum number of items to return
             
         Returns:
             List of item properties
         """
-        query = """
-        MATCH (i:Item)-[:BELONGS_TO]->(c:Category {name: $category_name})
-        RETURN i
-        """
-        result = self.db.execute_query(query, {"category_name": category_name})
-        return [record["i"] for record in result]
+        nodes = self.db.fetch_values(_FIND_ITEMS_BY_CATEGORY_QUERY, {"category_name": category_name, "skip": skip, "limit": limit}, "i")
+        return [_properties(node) for node in nodes]
     
     def get_item_details(self, item_name: str) -> Optional[dict[str, Any]]:
         """Get detailed information about an item including relationships.
@@ -231,34 +673,45 @@ class GraphOperations:
             item_name: Name of the item
             
         Returns:
-            Item details with location, category, and owner information
-        """
-        query = """
-        MATCH (i:Item {name: $item_name})
-        OPTIONAL MATCH (i)-[:LOCATED_IN]->(l:Location)
-        OPTIONAL MATCH (i)-[:BELONGS_TO]->(c:Category)
-        OPTIONAL MATCH (i)-[:OWNED_BY]->(p:Person)
-        RETURN i, l.name as location, c.name as category, p.name as owner
+            Item details with the names of all its locations, categories, and owners
         """
-        result = self.db.execute_query(query, {"item_name": item_name})
-        if not result:
+        record = self.db.fetch_one(_GET_ITEM_DETAILS_QUERY, {"item_name": item_name})
+        if record is None:
             return None
         
-        record = result[0]
-        details = dict(record["i"])
-        details["location"] = record.get("location")
-        details["category"] = record.get("category")
-        details["owner"] = record.get("owner")
-        return details
+        return {
+            **_properties(record["i"]),
+            "locations": record["locations"],
+            "categories": record["categories"],
+            "owners": record["owners"]
+        }
     
-    def list_all_locations(self) -> list[dict[str, Any]]:
-        """List all locations in the graph."""
-        query = "MATCH (l:Location) RETURN l ORDER BY l.name"
-        result = self.db.execute_query(query)
-        return [record["l"] for record in result]
+    def iter_locations(self) -> Iterator[dict[str, Any]]:
+        """Yield every location in the graph as it arrives, ordered by name."""
+        for record in self.db.stream_query(_ITER_LOCATIONS_QUERY):
+            yield _properties(record["l"])
     
-    def list_all_categories(self) -> list[dict[str, Any]]:
-        """List all categories in the graph."""
-        query = "MATCH (c:Category) RETURN c ORDER BY c.name"
-        result = self.db.execute_query(query)
-        return [record["c"] for record in result]
+    def list_all_locations(self, skip: int = 0, limit: int = DEFAULT_LIMIT) -> list[dict[str, Any]]:
+        """List locations in the graph, ordered by name.
+        
+        Args:
+            skip: Number of locations to skip
+            limit: Maximum number of locations to return
+        """
+        nodes = self.db.fetch_values(_LIST_ALL_LOCATIONS_QUERY, {"skip": skip, "limit": limit}, "l")
+        return [_properties(node) for node in nodes]
+    
+    def iter_categories(self) -> Iterator[dict[str, Any]]:
+        """Yield every category in the graph as it arrives, ordered by name."""
+        for record in self.db.stream_query(_ITER_CATEGORIES_QUERY):
+            yield _properties(record["c"])
+    
+    def list_all_categories(self, skip: int = 0, limit: int = DEFAULT_LIMIT) -> list[dict[str, Any]]:
+        """List categories in the graph, ordered by name.
+        
+        Args:
+            skip: Number of categories to skip
+            limit: Maximum number of categories to return
+        """
+        nodes = self.db.fetch_values(_LIST_ALL_CATEGORIES_QUERY, {"skip": skip, "limit": limit}, "c")
+        return [_properties(node) for node in nodes]
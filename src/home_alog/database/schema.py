@@ -1,5 +1,6 @@
 """Home inventory knowledge graph schema definitions."""
 
+from datetime import date
 from enum import Enum
 from typing import TypedDict
 
@@ -24,7 +25,7 @@ class ItemProperties(TypedDict, total=False):
     """Properties for Item nodes."""
     name: str
     description: str
-    purchase_date: str
+    purchase_date: date  # ISO strings are accepted and stored as a native date
     value: float
     quantity: int
     notes: str